@@ -2,20 +2,21 @@
 # -*- coding: utf-8 -*-
 
 import os
+import csv
 import json
 import sys
 import glob
 import argparse
+import functools
+import hashlib
 import logging
+import tempfile
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from collections import Counter
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud
-import pandas as pd
 import numpy as np
-import jieba
-import jieba.posseg as pseg
 
 # 设置日志
 logging.basicConfig(
@@ -24,6 +25,137 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 单文件并行分析的最小文本长度（字符数）
+PARALLEL_MIN_CHARS = 100_000
+
+# 分词结果的磁盘缓存目录（按文本摘要命名，跨进程、跨运行复用）
+TOKEN_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'gender_analyzer_token_cache')
+
+# 磁盘缓存的大小上限（字节），超出后按修改时间淘汰最旧的条目
+TOKEN_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# 超过该大小（字节）的文件按块流式读取，避免整体载入内存
+STREAM_MIN_BYTES = 4 * 1024 * 1024
+
+# 生成词云所需的最少不同形容词数
+WORDCLOUD_MIN_WORDS = 2
+
+# 流式读取的目标块大小（字符数）
+STREAM_BLOCK_CHARS = 1_000_000
+
+def _iter_text_blocks(f, block_chars=STREAM_BLOCK_CHARS):
+    """按块读取文本，块之间在段落边界（空行）处切开"""
+    buf = ''
+    while True:
+        chunk = f.read(block_chars)
+        if not chunk:
+            break
+        buf += chunk
+        cut = buf.rfind('\n\n')
+        if cut == -1:
+            continue
+        yield buf[:cut]
+        buf = buf[cut + 2:]
+    if buf:
+        yield buf
+
+def _intern_set(values):
+    """把词表固化为驻留字符串的frozenset，加速哈希比较"""
+    return frozenset(sys.intern(v) for v in values)
+
+def _load_jieba():
+    """按需导入jieba并压低其默认日志级别
+
+    词典构建本身由jieba惰性完成；这里只保证
+    不分词的路径（如--help、纯可视化）完全不付导入开销，
+    同时屏蔽“Building prefix dict...”等预热日志。
+    """
+    import jieba
+    import jieba.posseg as pseg
+    jieba.setLogLevel(logging.WARNING)
+    return jieba, pseg
+
+def enable_jieba_parallel(processnum=None):
+    """开启jieba自带的并行分词（仅限posix系统）
+
+    开启后pseg.cut会按行分发到jieba内部的进程池，
+    因此本工具自身的块级/文件级进程池会自动退回串行，避免双重派生。
+    """
+    if os.name == 'nt':
+        logger.warning("jieba并行分词不支持Windows，已忽略")
+        return False
+    try:
+        jieba, _ = _load_jieba()
+        jieba.enable_parallel(processnum)
+        return True
+    except Exception as e:
+        logger.error(f"开启jieba并行分词失败: {e}")
+        return False
+
+def _jieba_parallel_active():
+    """jieba自带并行模式是否已开启"""
+    jieba = sys.modules.get('jieba')
+    return jieba is not None and getattr(jieba, 'pool', None) is not None
+
+def _analyze_chunk(args):
+    """在工作进程中分析单个文本块"""
+    analyzer, chunk, memoize = args
+    return analyzer.analyze(chunk, memoize=memoize)
+
+def _prune_token_cache():
+    """磁盘缓存超过上限时按修改时间淘汰最旧的条目"""
+    try:
+        entries = []
+        total = 0
+        with os.scandir(TOKEN_CACHE_DIR) as it:
+            for entry in it:
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= TOKEN_CACHE_MAX_BYTES:
+                break
+            os.remove(path)
+            total -= size
+    except OSError as e:
+        logger.debug(f"清理分词缓存失败: {e}")
+
+def _tokenize(text_digest, text, disk_cache=True):
+    """分词和词性标注（可选按文本摘要做磁盘缓存，同一文本只做一次pseg切分）"""
+    cache_path = os.path.join(TOKEN_CACHE_DIR, f'{text_digest}.json')
+    if disk_cache:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                words_list, pos_list = json.load(f)
+            return tuple(words_list), tuple(pos_list)
+        except (OSError, ValueError):
+            pass
+
+    _, pseg = _load_jieba()
+    pairs = pseg.lcut(text)
+    words_list = tuple(word for word, _ in pairs)
+    pos_list = tuple(flag for _, flag in pairs)
+
+    if disk_cache:
+        try:
+            os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+            # 先写临时文件再改名，避免并行工作进程写坏缓存
+            tmp_path = f'{cache_path}.{os.getpid()}'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump([words_list, pos_list], f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+            _prune_token_cache()
+        except OSError as e:
+            logger.debug(f"写入分词缓存失败: {e}")
+
+    return words_list, pos_list
+
+@functools.lru_cache(maxsize=32)
+def _tokenize_memoized(text_digest, text):
+    """带内存LRU的分词入口，常规（非流式）文本走这里"""
+    return _tokenize(text_digest, text)
+
 class ProgressBar:
     """进度条类"""
     def __init__(self, total, prefix='', suffix='', length=50, fill='█', empty='░', color=True):
@@ -86,16 +218,25 @@ class ProgressBar:
         else:
             return f"{s:d}s"
 
+class _NoopProgress:
+    """占位进度条，供并行工作进程静默使用"""
+    def update(self, count=None):
+        pass
+
 class GenderStereotypeAnalyzer:
-    def __init__(self, config_file=None):
+    def __init__(self, config_file=None, use_cache=True):
         """初始化分析器"""
-        self.male_keywords = set()
-        self.female_keywords = set()
-        self.stopwords = set()
-        self.adjective_pos_tags = set()
+        self.use_cache = use_cache
+        self.male_keywords = frozenset()
+        self.female_keywords = frozenset()
+        self.stopwords = frozenset()
+        self.adjective_pos_tags = frozenset()
         self.window_size = 3
         self.font_path = None
-        
+        self._keyword_gender = {}
+        self._keyword_arr = np.empty(0, dtype=object)
+        self._adj_tag_arr = np.empty(0, dtype=object)
+
         if config_file:
             self.load_config(config_file)
         else:
@@ -106,12 +247,13 @@ class GenderStereotypeAnalyzer:
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-                self.male_keywords = set(config.get('male_keywords', []))
-                self.female_keywords = set(config.get('female_keywords', []))
-                self.stopwords = set(config.get('stopwords', []))
-                self.adjective_pos_tags = set(config.get('adjective_pos_tags', []))
+                self.male_keywords = _intern_set(config.get('male_keywords', []))
+                self.female_keywords = _intern_set(config.get('female_keywords', []))
+                self.stopwords = _intern_set(config.get('stopwords', []))
+                self.adjective_pos_tags = _intern_set(config.get('adjective_pos_tags', []))
                 self.window_size = config.get('window_size', 3)
                 self.font_path = config.get('font_path', 'simhei.ttf')
+            self._refresh_keyword_index()
         except Exception as e:
             logger.error(f"加载配置文件失败: {e}")
             self.load_default_config()
@@ -124,13 +266,26 @@ class GenderStereotypeAnalyzer:
         except Exception as e:
             logger.error(f"加载默认配置失败: {e}")
             # 使用硬编码的默认值
-            self.male_keywords = {'他', '父亲', '儿子', '兄弟', '男人', '先生', '男孩'}
-            self.female_keywords = {'她', '母亲', '女儿', '姐妹', '女人', '女士', '女孩'}
-            self.stopwords = {'的', '了', '和', '是', '就', '都', '而', '及', '与', '着',
-                            '或', '一个', '没有', '这个', '那个', '这样', '那样'}
-            self.adjective_pos_tags = {'a', 'ad', 'an'}
+            self.male_keywords = _intern_set({'他', '父亲', '儿子', '兄弟', '男人', '先生', '男孩'})
+            self.female_keywords = _intern_set({'她', '母亲', '女儿', '姐妹', '女人', '女士', '女孩'})
+            self.stopwords = _intern_set({'的', '了', '和', '是', '就', '都', '而', '及', '与', '着',
+                                          '或', '一个', '没有', '这个', '那个', '这样', '那样'})
+            self.adjective_pos_tags = _intern_set({'a', 'ad', 'an'})
             self.window_size = 3
             self.font_path = 'simhei.ttf'
+            self._refresh_keyword_index()
+
+    def _refresh_keyword_index(self):
+        """重建词->性别的统一查找表，让分析阶段只扫描一次词表
+
+        同时把词表和词性标签固化成排好序的numpy数组，
+        np.isin在分析阶段可以直接二分查找，不用每次重建数组。
+        """
+        index = {word: 'male' for word in self.male_keywords}
+        index.update({word: 'female' for word in self.female_keywords})
+        self._keyword_gender = index
+        self._keyword_arr = np.array(sorted(index), dtype=object)
+        self._adj_tag_arr = np.array(sorted(self.adjective_pos_tags), dtype=object)
     
     def save_config(self, config_file):
         """保存配置到文件"""
@@ -158,167 +313,241 @@ class GenderStereotypeAnalyzer:
         print(f"当前默认值：{' '.join(self.male_keywords)}")
         custom_male = input().strip()
         if custom_male:
-            self.male_keywords.update(custom_male.split())
+            self.male_keywords |= _intern_set(custom_male.split())
         
         # 获取用户自定义的女性关键词
         print("\n请输入额外的女性相关词汇（用空格分隔，直接回车使用默认值）：")
         print(f"当前默认值：{' '.join(self.female_keywords)}")
         custom_female = input().strip()
         if custom_female:
-            self.female_keywords.update(custom_female.split())
+            self.female_keywords |= _intern_set(custom_female.split())
         
         # 获取用户自定义的停用词
         print("\n请输入额外的停用词（用空格分隔，直接回车使用默认值）：")
         print(f"当前默认值：{' '.join(self.stopwords)}")
         custom_stopwords = input().strip()
         if custom_stopwords:
-            self.stopwords.update(custom_stopwords.split())
+            self.stopwords |= _intern_set(custom_stopwords.split())
         
         # 保存配置
+        self._refresh_keyword_index()
         config_path = os.path.join(os.path.dirname(__file__), 'config.json')
         self.save_config(config_path)
         print(f"\n配置已保存到：{config_path}")
         print("下次使用时将自动加载此配置。")
     
-    def preprocess_text(self, text):
-        """预处理文本"""
+    def preprocess_text(self, text, memoize=True):
+        """预处理文本，返回(词列表, 词性列表)
+
+        memoize=False时跳过内存LRU（流式分析的一次性块不应被钉在内存里，
+        重复运行仍由磁盘缓存覆盖）。
+        """
         try:
-            # 分词和词性标注
-            words = pseg.cut(text)
-            return [(word, flag) for word, flag in words]
+            # 以文本摘要为键缓存分词结果，避免重复的pseg切分
+            digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+            if self.use_cache and memoize:
+                return _tokenize_memoized(digest, text)
+            return _tokenize(digest, text, disk_cache=self.use_cache)
         except Exception as e:
             logger.error(f"文本预处理失败: {e}")
-            return []
-    
-    def extract_adjectives(self, words, target_word):
-        """提取形容词"""
-        try:
-            adjectives = []
-            for i, (word, pos) in enumerate(words):
-                if word == target_word:
-                    # 向前查找
-                    for j in range(max(0, i - self.window_size), i):
-                        if words[j][1] in self.adjective_pos_tags:
-                            adjectives.append(words[j][0])
-                    # 向后查找
-                    for j in range(i + 1, min(len(words), i + self.window_size + 1)):
-                        if words[j][1] in self.adjective_pos_tags:
-                            adjectives.append(words[j][0])
-            return adjectives
-        except Exception as e:
-            logger.error(f"提取形容词失败: {e}")
-            return []
+            return (), ()
     
-    def find_cooccurrences(self, words):
+    def find_cooccurrences(self, words_list):
         """查找性别关键词的共现"""
         try:
             cooccurrences = []
-            for i, (word, _) in enumerate(words):
-                if word in self.male_keywords or word in self.female_keywords:
+            for i, word in enumerate(words_list):
+                if word in self._keyword_gender:
                     # 获取上下文窗口
                     start = max(0, i - self.window_size)
-                    end = min(len(words), i + self.window_size + 1)
-                    context = [w for w, _ in words[start:end]]
+                    end = min(len(words_list), i + self.window_size + 1)
+                    context = list(words_list[start:end])
                     cooccurrences.append((word, context))
             return cooccurrences
         except Exception as e:
             logger.error(f"查找共现失败: {e}")
             return []
-    
-    def analyze(self, text):
+
+    def analyze(self, text, memoize=True):
         """分析文本中的性别刻板印象"""
         try:
             # 预处理文本
-            words = self.preprocess_text(text)
-            
-            # 创建进度条
-            progress = ProgressBar(len(words), prefix='分析文本', suffix='', length=40)
-            
-            # 统计性别关键词的形容词
+            words_list, pos_list = self.preprocess_text(text, memoize=memoize)
+
+            # 一次性转为numpy数组，关键词/词性匹配在C层完成
+            words_arr = np.array(words_list, dtype=object)
+            pos_arr = np.array(pos_list, dtype=object)
+            # 词流整数编码：成员测试只在小词汇表上做一次，
+            # 再按整数码表展开回词流，长文本上远快于逐词字符串比较
+            word_vocab, word_codes = np.unique(words_arr, return_inverse=True)
+            pos_vocab, pos_codes = np.unique(pos_arr, return_inverse=True)
+            keyword_mask = np.isin(word_vocab, self._keyword_arr, kind='sort')[word_codes]
+            adj_mask = np.isin(pos_vocab, self._adj_tag_arr, kind='sort')[pos_codes]
+
+            hits = np.flatnonzero(keyword_mask)
+            male_hits = [i for i in hits if self._keyword_gender[words_arr[i]] == 'male']
+            female_hits = [i for i in hits if self._keyword_gender[words_arr[i]] == 'female']
+
+            # 形容词位置升序索引：窗口查询退化为两次二分查找
+            adj_indices = np.flatnonzero(adj_mask)
+
+            def gather(hits, adjectives):
+                """二分定位窗口内的形容词位置并收集对应词"""
+                for i in hits:
+                    lo = np.searchsorted(adj_indices, i - self.window_size)
+                    hi = np.searchsorted(adj_indices, i + self.window_size + 1)
+                    for j in adj_indices[lo:hi]:
+                        if j != i:
+                            adjectives.append(words_arr[j])
+
             male_adjectives = []
             female_adjectives = []
+            gather(male_hits, male_adjectives)
+            gather(female_hits, female_adjectives)
             
-            for i, (word, _) in enumerate(words):
-                if word in self.male_keywords:
-                    adjectives = self.extract_adjectives(words, word)
-                    male_adjectives.extend(adjectives)
-                elif word in self.female_keywords:
-                    adjectives = self.extract_adjectives(words, word)
-                    female_adjectives.extend(adjectives)
-                
-                # 更新进度条（每10个词更新一次，以避免过多IO操作）
-                if i % 10 == 0 or i == len(words) - 1:
-                    progress.update(i + 1)
-            
-            # 统计词频
-            male_counter = Counter(male_adjectives)
-            female_counter = Counter(female_adjectives)
-            
-            return male_counter, female_counter
+            # 统计词频（np.unique在C层完成排序计数）
+            return self._count_frequencies(male_adjectives), self._count_frequencies(female_adjectives)
         except Exception as e:
             logger.error(f"分析文本失败: {e}")
             return Counter(), Counter()
-    
-    def visualize(self, male_counter, female_counter, output_dir):
+
+    @staticmethod
+    def _count_frequencies(words):
+        """用np.unique统计词频，返回Counter"""
+        if not words:
+            return Counter()
+        values, counts = np.unique(np.array(words, dtype=object), return_counts=True)
+        return Counter(dict(zip(values.tolist(), counts.tolist())))
+
+    @staticmethod
+    def _split_chunks(text, n_chunks):
+        """按段落边界把文本切成n个长度相近的连续块"""
+        paragraphs = text.split('\n\n')
+        target = max(len(text) // n_chunks, 1)
+        chunks = []
+        current = []
+        current_len = 0
+        for paragraph in paragraphs:
+            current.append(paragraph)
+            current_len += len(paragraph) + 2
+            if current_len >= target and len(chunks) < n_chunks - 1:
+                chunks.append('\n\n'.join(current))
+                current = []
+                current_len = 0
+        if current:
+            chunks.append('\n\n'.join(current))
+        return chunks
+
+    def analyze_parallel(self, text, n_workers=None, pool=None, memoize=True):
+        """把大文本按段落切块并行分析，合并各块的统计结果
+
+        传入pool时复用调用方的进程池（流式分析按块重复调用时，
+        不必每块重新派生进程、重新预热jieba词典）；否则自建临时池。
+
+        注意：窗口不跨越块边界，极少量落在边界上的共现会被忽略。
+        """
+        try:
+            n_workers = n_workers or os.cpu_count() or 1
+            if pool is None and (n_workers == 1 or len(text) < PARALLEL_MIN_CHARS
+                                 or _jieba_parallel_active()):
+                return self.analyze(text, memoize=memoize)
+
+            chunks = self._split_chunks(text, n_workers)
+            if pool is None and len(chunks) == 1:
+                return self.analyze(text, memoize=memoize)
+
+            tasks = [(self, chunk, memoize) for chunk in chunks]
+            if pool is not None:
+                results = pool.map(_analyze_chunk, tasks)
+            else:
+                with multiprocessing.Pool(len(chunks), initializer=_warm_jieba) as own_pool:
+                    results = own_pool.map(_analyze_chunk, tasks)
+
+            male_counter = Counter()
+            female_counter = Counter()
+            for male_part, female_part in results:
+                male_counter.update(male_part)
+                female_counter.update(female_part)
+            return male_counter, female_counter
+        except Exception as e:
+            logger.error(f"并行分析文本失败: {e}")
+            return Counter(), Counter()
+
+    def visualize(self, male_counter, female_counter, output_dir, show_progress=True):
         """可视化分析结果"""
         try:
+            # 绘图库只在真正出图时导入；统一用Agg后端，
+            # 纯分析路径不用再付matplotlib的启动开销，也不依赖显示环境
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            from wordcloud import WordCloud
+
             # 创建输出目录
             os.makedirs(output_dir, exist_ok=True)
             
-            # 显示可视化进度
-            print("\n开始生成可视化结果...")
-            progress = ProgressBar(4, prefix='生成可视化', suffix='', length=40)
+            # 显示可视化进度（并行工作进程中静默，避免输出交错）
+            if show_progress:
+                print("\n开始生成可视化结果...")
+                progress = ProgressBar(4, prefix='生成可视化', suffix='', length=40)
+            else:
+                progress = _NoopProgress()
             
-            # 生成词云
-            male_wordcloud = WordCloud(
-                font_path=self.font_path,
-                width=800,
-                height=400,
-                background_color='white'
-            ).generate_from_frequencies(male_counter)
+            # 生成词云（词频为空或过少时直接跳过，WordCloud渲染开销不小）
+            def build_wordcloud(counter):
+                if len(counter) < WORDCLOUD_MIN_WORDS:
+                    return None
+                return WordCloud(
+                    font_path=self.font_path,
+                    width=800,
+                    height=400,
+                    background_color='white'
+                ).generate_from_frequencies(counter)
+
+            male_wordcloud = build_wordcloud(male_counter)
             progress.update()
-            
-            female_wordcloud = WordCloud(
-                font_path=self.font_path,
-                width=800,
-                height=400,
-                background_color='white'
-            ).generate_from_frequencies(female_counter)
+
+            female_wordcloud = build_wordcloud(female_counter)
             progress.update()
-            
+
             # 保存词云图
-            plt.figure(figsize=(10, 5))
-            plt.subplot(1, 2, 1)
-            plt.imshow(male_wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.title('男性形容词词云')
-            
-            plt.subplot(1, 2, 2)
-            plt.imshow(female_wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.title('女性形容词词云')
-            
-            plt.savefig(os.path.join(output_dir, 'wordcloud.png'))
-            plt.close()
+            if male_wordcloud is not None or female_wordcloud is not None:
+                plt.figure(figsize=(10, 5))
+                if male_wordcloud is not None:
+                    plt.subplot(1, 2, 1)
+                    plt.imshow(male_wordcloud, interpolation='bilinear')
+                    plt.axis('off')
+                    plt.title('男性形容词词云')
+
+                if female_wordcloud is not None:
+                    plt.subplot(1, 2, 2)
+                    plt.imshow(female_wordcloud, interpolation='bilinear')
+                    plt.axis('off')
+                    plt.title('女性形容词词云')
+
+                plt.savefig(os.path.join(output_dir, 'wordcloud.png'))
+                plt.close()
+            else:
+                logger.info("形容词过少，跳过词云生成")
             progress.update()
             
             # 生成对比柱状图和CSV报告
             plt.figure(figsize=(12, 6))
-            male_words = list(male_counter.keys())
-            male_counts = list(male_counter.values())
-            female_words = list(female_counter.keys())
-            female_counts = list(female_counter.values())
-            
-            # 获取所有出现的形容词
-            all_words = list(set(male_words + female_words))
-            
+
+            # 获取所有出现的形容词，频次数组只构建一次，柱状图和报告共用
+            all_words = list(male_counter.keys() | female_counter.keys())
+            male_counts = np.fromiter((male_counter.get(word, 0) for word in all_words),
+                                      dtype=np.int64, count=len(all_words))
+            female_counts = np.fromiter((female_counter.get(word, 0) for word in all_words),
+                                        dtype=np.int64, count=len(all_words))
+
             if all_words:  # 确保有形容词
                 x = np.arange(len(all_words))
                 width = 0.35
-                
-                plt.bar(x - width/2, [male_counter.get(word, 0) for word in all_words], width, label='男性')
-                plt.bar(x + width/2, [female_counter.get(word, 0) for word in all_words], width, label='女性')
-                
+
+                plt.bar(x - width/2, male_counts, width, label='男性')
+                plt.bar(x + width/2, female_counts, width, label='女性')
+
                 plt.xlabel('形容词')
                 plt.ylabel('频次')
                 plt.title('性别形容词使用对比')
@@ -329,40 +558,64 @@ class GenderStereotypeAnalyzer:
                 plt.savefig(os.path.join(output_dir, 'comparison.png'))
                 plt.close()
             
-            # 生成CSV报告
-            df = pd.DataFrame({
-                '形容词': all_words,
-                '男性频次': [male_counter.get(word, 0) for word in all_words],
-                '女性频次': [female_counter.get(word, 0) for word in all_words]
-            })
-            df.to_csv(os.path.join(output_dir, 'report.csv'), index=False, encoding='utf-8-sig')
+            # 生成CSV报告（复用上面的频次数组）
+            with open(os.path.join(output_dir, 'report.csv'), 'w',
+                      encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['形容词', '男性频次', '女性频次'])
+                writer.writerows(zip(all_words, male_counts.tolist(), female_counts.tolist()))
             progress.update()
             
-            print(f"\n✅ 分析完成！结果已保存到: {output_dir}")
-            
+            if show_progress:
+                print(f"\n✅ 分析完成！结果已保存到: {output_dir}")
+
         except Exception as e:
             logger.error(f"生成可视化结果失败: {e}")
             print(f"\n❌ 生成可视化结果失败: {e}")
 
-def analyze_file(input_file, output_dir, config_file=None):
+def analyze_file(input_file, output_dir, config_file=None, jobs=None, use_cache=True):
     """分析单个文件"""
     try:
         # 创建分析器
-        analyzer = GenderStereotypeAnalyzer(config_file)
+        analyzer = GenderStereotypeAnalyzer(config_file, use_cache=use_cache)
         
         # 显示文件信息
-        file_size = os.path.getsize(input_file) / 1024  # KB
-        print(f"\n📄 正在分析文件: {os.path.basename(input_file)} ({file_size:.2f} KB)")
-        
-        # 读取文本
-        with open(input_file, 'r', encoding='utf-8') as f:
-            text = f.read()
-        
-        # 显示文本信息
-        print(f"📊 文本长度: {len(text)} 字符")
-        
-        # 分析文本
-        male_counter, female_counter = analyzer.analyze(text)
+        file_size_bytes = os.path.getsize(input_file)
+        print(f"\n📄 正在分析文件: {os.path.basename(input_file)} ({file_size_bytes / 1024:.2f} KB)")
+
+        if file_size_bytes >= STREAM_MIN_BYTES:
+            # 大文件按段落块流式读取，内存占用与块大小成正比；
+            # 整个文件共用一个进程池，jieba词典每个工作进程只预热一次
+            male_counter = Counter()
+            female_counter = Counter()
+            total_chars = 0
+            n_workers = jobs or os.cpu_count() or 1
+            pool = None
+            if n_workers > 1 and not _jieba_parallel_active():
+                pool = multiprocessing.Pool(n_workers, initializer=_warm_jieba)
+            try:
+                with open(input_file, 'r', encoding='utf-8') as f:
+                    for block in _iter_text_blocks(f):
+                        total_chars += len(block)
+                        male_part, female_part = analyzer.analyze_parallel(
+                            block, n_workers, pool=pool, memoize=False)
+                        male_counter.update(male_part)
+                        female_counter.update(female_part)
+            finally:
+                if pool is not None:
+                    pool.close()
+                    pool.join()
+            print(f"📊 文本长度: {total_chars} 字符")
+        else:
+            # 读取文本
+            with open(input_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+
+            # 显示文本信息
+            print(f"📊 文本长度: {len(text)} 字符")
+
+            # 分析文本（大文本自动切块并行）
+            male_counter, female_counter = analyzer.analyze_parallel(text, jobs)
         
         # 显示统计信息
         print(f"\n📈 分析结果统计:")
@@ -377,38 +630,80 @@ def analyze_file(input_file, output_dir, config_file=None):
         print(f"\n❌ 分析文件失败: {e}")
         sys.exit(1)
 
-def analyze_directory(input_dir, output_dir, config_file=None):
+def _warm_jieba():
+    """进程池初始化：让每个工作进程提前构建jieba词典"""
+    jieba, _ = _load_jieba()
+    jieba.initialize()
+
+def _analyze_one(input_file, config_file=None, use_cache=True):
+    """在工作进程中分析单个文件，返回统计结果"""
+    analyzer = GenderStereotypeAnalyzer(config_file, use_cache=use_cache)
+    with open(input_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return analyzer.analyze(text)
+
+def _render_one(male_counter, female_counter, output_dir, config_file=None):
+    """在工作进程中生成单个文件的可视化输出"""
+    analyzer = GenderStereotypeAnalyzer(config_file)
+    analyzer.visualize(male_counter, female_counter, output_dir, show_progress=False)
+
+def analyze_directory(input_dir, output_dir, config_file=None, jobs=None, use_cache=True):
     """分析整个目录"""
     try:
         # 获取所有文本文件
         text_files = glob.glob(os.path.join(input_dir, '*.txt'))
-        
+
         if not text_files:
             logger.warning(f"在目录 {input_dir} 中没有找到文本文件")
             print(f"\n❗ 警告: 在目录 {input_dir} 中没有找到文本文件")
             return
-        
+
         # 显示目录信息
         print(f"\n📁 正在分析目录: {input_dir}")
         print(f"📚 发现 {len(text_files)} 个文本文件")
-        
-        # 创建进度条
-        progress = ProgressBar(len(text_files), prefix='分析文件', suffix='', length=40)
-        
-        # 为每个文件创建单独的输出目录
-        for i, text_file in enumerate(text_files):
-            filename = os.path.basename(text_file)
-            file_output_dir = os.path.join(output_dir, os.path.splitext(filename)[0])
-            
-            # 更新进度条的后缀显示当前处理的文件
-            progress.suffix = f"- {filename}"
-            progress.update(i + 1)
-            
-            # 分析文件
-            analyze_file(text_file, file_output_dir, config_file)
-            
+
+        jobs = jobs or os.cpu_count() or 1
+
+        if jobs == 1 or len(text_files) == 1 or _jieba_parallel_active():
+            # 串行路径：保留逐文件的详细输出
+            progress = ProgressBar(len(text_files), prefix='分析文件', suffix='', length=40)
+            for i, text_file in enumerate(text_files):
+                filename = os.path.basename(text_file)
+                file_output_dir = os.path.join(output_dir, os.path.splitext(filename)[0])
+
+                # 更新进度条的后缀显示当前处理的文件
+                progress.suffix = f"- {filename}"
+                progress.update(i + 1)
+
+                # 分析文件
+                analyze_file(text_file, file_output_dir, config_file, jobs=jobs,
+                             use_cache=use_cache)
+        else:
+            # 并行路径：文件级进程池，各进程初始化时预热jieba词典；
+            # 分析完成的文件立即把可视化任务交回同一个池，渲染与分析重叠
+            progress = ProgressBar(len(text_files), prefix='分析文件', suffix='', length=40)
+            with ProcessPoolExecutor(max_workers=min(jobs, len(text_files)),
+                                     initializer=_warm_jieba) as executor:
+                futures = {
+                    executor.submit(_analyze_one, text_file, config_file, use_cache): text_file
+                    for text_file in text_files
+                }
+                render_futures = []
+                for future in as_completed(futures):
+                    text_file = futures[future]
+                    filename = os.path.basename(text_file)
+                    file_output_dir = os.path.join(output_dir, os.path.splitext(filename)[0])
+                    male_counter, female_counter = future.result()
+                    render_futures.append(executor.submit(
+                        _render_one, male_counter, female_counter,
+                        file_output_dir, config_file))
+                    progress.suffix = f"- {filename}"
+                    progress.update()
+                for render_future in render_futures:
+                    render_future.result()
+
         print(f"\n✅ 目录分析完成！结果已保存到: {output_dir}")
-            
+
     except Exception as e:
         logger.error(f"分析目录失败: {e}")
         print(f"\n❌ 分析目录失败: {e}")
@@ -420,6 +715,13 @@ def main():
     parser.add_argument('input', help='输入文件或目录的路径')
     parser.add_argument('-o', '--output', help='输出目录的路径', default='output')
     parser.add_argument('-c', '--config', help='配置文件的路径')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='并行分析的进程数（默认为CPU核心数）')
+    parser.add_argument('--jieba-parallel', type=int, nargs='?', const=0,
+                        default=None, metavar='N',
+                        help='开启jieba自带的并行分词（仅posix，N默认为CPU核心数）')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='禁用分词结果的内存与磁盘缓存')
     parser.add_argument('--setup', action='store_true', help='重新运行首次使用引导')
     
     args = parser.parse_args()
@@ -429,6 +731,10 @@ def main():
         logger.error(f"输入路径不存在: {args.input}")
         sys.exit(1)
     
+    # 可选：开启jieba自带并行分词
+    if args.jieba_parallel is not None:
+        enable_jieba_parallel(args.jieba_parallel or None)
+
     # 创建分析器
     analyzer = GenderStereotypeAnalyzer(args.config)
     
@@ -439,9 +745,11 @@ def main():
     
     # 根据输入类型选择分析函数
     if os.path.isfile(args.input):
-        analyze_file(args.input, args.output, args.config)
+        analyze_file(args.input, args.output, args.config, jobs=args.jobs,
+                     use_cache=not args.no_cache)
     else:
-        analyze_directory(args.input, args.output, args.config)
+        analyze_directory(args.input, args.output, args.config, jobs=args.jobs,
+                          use_cache=not args.no_cache)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file